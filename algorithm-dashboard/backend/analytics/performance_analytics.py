@@ -17,7 +17,10 @@ import threading
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# slots skip the per-instance __dict__ (these are allocated on every
+# execution and benchmark step); frozen because points are immutable
+# measurements once recorded
+@dataclass(slots=True, frozen=True)
 class PerformancePoint:
     """Single performance measurement point"""
     timestamp: float
@@ -4,20 +4,89 @@
 Comprehensive security measures for algorithm execution
 """
 
+import ast
 import os
 import pwd
 import grp
 import resource
-import signal
+import threading
 import time
 import psutil
 import logging
+import numpy as np
 from typing import Dict, List, Any, Optional
+from collections import Counter
 from dataclasses import dataclass
+from enum import IntEnum
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Default policy lists - built once at import time instead of per-manager
+DEFAULT_ALLOWED_IMPORTS = (
+    'math', 'json', 'time', 'random', 'itertools', 'functools',
+    'collections', 'heapq', 'bisect', 'typing', 'dataclasses'
+)
+DEFAULT_BLOCKED_FUNCTIONS = (
+    'eval', 'exec', 'compile', '__import__', 'open', 'file',
+    'input', 'raw_input', 'exit', 'quit', 'reload'
+)
+
+# Patterns flagged during the AST walk - built once at import time
+# Upper bound on concurrently monitored sessions (sizes the metric arrays)
+MAX_SESSIONS = 1024
+
+_PAGESIZE = resource.getpagesize()
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+_HAS_PROC = os.path.isdir('/proc/self')
+_NUM_CPUS = psutil.cpu_count() or 1
+
+SUSPICIOUS_BUILTINS = frozenset({
+    'globals', 'locals', 'vars', 'setattr', 'getattr', 'hasattr', 'delattr'
+})
+SUSPICIOUS_CALLS = frozenset({
+    'os.system', 'os.popen', 'os.exec', 'os.execv', 'os.execvp',
+    'subprocess.run', 'subprocess.call', 'subprocess.Popen', 'subprocess.check_output'
+})
+SUSPICIOUS_NAMES = frozenset({'__builtins__', '__globals__', '__locals__'})
+FILE_OP_METHODS = frozenset({'read', 'write', 'open'})
+
+# Aho-Corasick automaton for the danger-token prescan when available;
+# a tuple of `in` checks covers the same tokens otherwise
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional compiled validator (Cython/mypyc build of security_fast.pyx).
+# The pure-Python walk below stays the reference implementation and the
+# fallback wherever the extension hasn't been built.
+try:
+    import security_fast as _security_fast
+except ImportError:
+    _security_fast = None
+
+class ViolationKind(IntEnum):
+    """Compact violation identifiers - formatted into text only at report time"""
+    MEMORY = 0
+    CPU = 1
+    TIME = 2
+    FILES = 3
+    NETWORK = 4
+
+# Kinds that warrant immediate termination
+CRITICAL_VIOLATIONS = frozenset({
+    ViolationKind.MEMORY, ViolationKind.TIME, ViolationKind.NETWORK
+})
+
+_VIOLATION_TEMPLATES = {
+    ViolationKind.MEMORY: "Memory usage ({value:.1f}MB) exceeds limit ({limit}MB)",
+    ViolationKind.CPU: "CPU usage ({value:.1f}%) exceeds limit ({limit}%)",
+    ViolationKind.TIME: "Execution time ({value:.1f}s) exceeds limit ({limit}s)",
+    ViolationKind.FILES: "Open files ({value:.0f}) exceeds limit ({limit})",
+    ViolationKind.NETWORK: "Unauthorized network connections detected ({value:.0f})",
+}
+
 @dataclass
 class SecurityConfig:
     """Security configuration settings"""
@@ -52,18 +121,71 @@ class SecurityManager:
         
         # Set default allowed imports if not specified
         if self.config.allowed_imports is None:
-            self.config.allowed_imports = [
-                'math', 'json', 'time', 'random', 'itertools', 'functools',
-                'collections', 'heapq', 'bisect', 'typing', 'dataclasses'
-            ]
-        
+            self.config.allowed_imports = list(DEFAULT_ALLOWED_IMPORTS)
+
         # Set default blocked functions if not specified
         if self.config.blocked_functions is None:
-            self.config.blocked_functions = [
-                'eval', 'exec', 'compile', '__import__', 'open', 'file',
-                'input', 'raw_input', 'exit', 'quit', 'reload'
-            ]
-    
+            self.config.blocked_functions = list(DEFAULT_BLOCKED_FUNCTIONS)
+
+        # Frozensets for O(1) membership checks during the AST walk
+        self._blocked_set = frozenset(self.config.blocked_functions)
+        self._allowed_set = frozenset(self.config.allowed_imports)
+
+        # Tokens that force the full AST pass; code containing none of them
+        # can't trip any check below, so validation short-circuits. Derived
+        # from the live policy sets so custom blocked functions are covered.
+        # 'import' catches both import forms, 'subprocess'/'os.' the dotted
+        # calls, '__' the dunder-name probes.
+        self._danger_tokens = tuple(
+            self._blocked_set | SUSPICIOUS_BUILTINS | FILE_OP_METHODS
+        ) + ('import', 'subprocess', 'os.', '__')
+        if ahocorasick is not None:
+            self._danger_automaton = ahocorasick.Automaton()
+            for token in self._danger_tokens:
+                self._danger_automaton.add_word(token, token)
+            self._danger_automaton.make_automaton()
+        else:
+            self._danger_automaton = None
+
+        # Struct-of-arrays metric store: one compact slot per session so
+        # aggregates (total memory, violation counts) are single vectorized
+        # reductions instead of per-Process psutil calls
+        self._pids = np.zeros(MAX_SESSIONS, dtype=np.int32)
+        self._mem_mb = np.zeros(MAX_SESSIONS, dtype=np.float32)
+        self._cpu = np.zeros(MAX_SESSIONS, dtype=np.float32)
+        self._viol_count = np.zeros(MAX_SESSIONS, dtype=np.uint16)
+        self._active_mask = np.zeros(MAX_SESSIONS, dtype=bool)
+        self._session_slots: Dict[str, int] = {}
+        self._free_slots = list(range(MAX_SESSIONS - 1, -1, -1))
+
+    def _acquire_slot(self, session_id: str, pid: int) -> int:
+        """Map a session to a compact array slot (reused via freelist)"""
+        slot = self._session_slots.get(session_id)
+        if slot is None:
+            slot = self._free_slots.pop() if self._free_slots else 0
+            self._session_slots[session_id] = slot
+            self._pids[slot] = pid
+            self._viol_count[slot] = 0
+            self._active_mask[slot] = True
+        return slot
+
+    def _release_slot(self, session_id: str):
+        """Return a session's slot to the freelist"""
+        slot = self._session_slots.pop(session_id, None)
+        if slot is not None:
+            self._active_mask[slot] = False
+            self._mem_mb[slot] = 0.0
+            self._cpu[slot] = 0.0
+            self._free_slots.append(slot)
+
+    def find_memory_violations(self) -> List[str]:
+        """Vectorized scan for sessions over the memory limit"""
+        mask = self._active_mask & (self._mem_mb > self.config.max_memory_mb)
+        if not mask.any():
+            return []
+        offending = set(np.where(mask)[0].tolist())
+        return [sid for sid, slot in self._session_slots.items() if slot in offending]
+
     def create_secure_environment(self, session_id: str) -> Dict[str, Any]:
         """Create secure execution environment"""
         try:
@@ -73,10 +195,16 @@ class SecurityManager:
             # Create restricted environment variables
             secure_env = self._create_restricted_env()
             
-            # Setup signal handlers for timeout
-            signal.signal(signal.SIGALRM, self._timeout_handler)
-            signal.alarm(self.config.max_execution_time)
-            
+            # Per-session timeout - signal.alarm is per-process, so a second
+            # session would silently overwrite the first session's deadline
+            timer = threading.Timer(
+                self.config.max_execution_time,
+                self.terminate_execution, args=(session_id, "Timeout")
+            )
+            timer.daemon = True
+            timer.start()
+            self.resource_monitors.setdefault(session_id, {'violations': Counter()})['timer'] = timer
+
             logger.info(f"🔒 Secure environment created for session {session_id}")
             
             return {
@@ -100,71 +228,236 @@ class SecurityManager:
             'blocked_items': [],
             'risk_level': 'LOW'
         }
-        
-        # Check for blocked functions
-        for func in self.config.blocked_functions:
-            if func in code:
-                security_report['safe'] = False
-                security_report['blocked_items'].append(f"Blocked function: {func}")
-                security_report['risk_level'] = 'HIGH'
-        
-        # Check for suspicious patterns
-        suspicious_patterns = [
-            'subprocess', 'os.system', 'os.popen', 'os.exec',
-            'import os', 'import sys', 'import subprocess',
-            '__builtins__', '__globals__', '__locals__',
-            'globals()', 'locals()', 'vars()',
-            'setattr', 'getattr', 'hasattr', 'delattr'
-        ]
-        
-        for pattern in suspicious_patterns:
-            if pattern in code:
-                security_report['warnings'].append(f"Suspicious pattern: {pattern}")
-                if security_report['risk_level'] == 'LOW':
-                    security_report['risk_level'] = 'MEDIUM'
-        
-        # Check import statements
-        import_lines = [line.strip() for line in code.split('\n') if line.strip().startswith('import') or line.strip().startswith('from')]
-        for line in import_lines:
-            module_name = self._extract_module_name(line)
-            if module_name and module_name not in self.config.allowed_imports:
-                security_report['warnings'].append(f"Unauthorized import: {module_name}")
-                if security_report['risk_level'] == 'LOW':
-                    security_report['risk_level'] = 'MEDIUM'
-        
-        # Check for file operations
-        file_operations = ['open(', 'file(', 'with open', 'read(', 'write(']
-        for op in file_operations:
-            if op in code:
-                if not self.config.file_system_access:
-                    security_report['safe'] = False
-                    security_report['blocked_items'].append(f"File operation: {op}")
-                    security_report['risk_level'] = 'HIGH'
-        
+
+        # Most submissions are benign: one linear scan for danger tokens
+        # decides whether the parse + walk is needed at all
+        if self._danger_automaton is not None:
+            clean = next(self._danger_automaton.iter(code), None) is None
+        else:
+            clean = not any(token in code for token in self._danger_tokens)
+        if clean:
+            return security_report
+
+        # Compiled extension does the same walk with C-level dispatch
+        if _security_fast is not None:
+            return _security_fast.validate_code_security(
+                code, self._blocked_set, self._allowed_set,
+                self.config.file_system_access
+            )
+
+        # One parse replaces dozens of substring scans, and checking real
+        # syntax nodes avoids false positives on e.g. 'eval' in a comment
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            security_report['safe'] = False
+            security_report['blocked_items'].append(f"Unparseable code: {e.msg} (line {e.lineno})")
+            security_report['risk_level'] = 'HIGH'
+            return security_report
+
+        def _warn(message: str):
+            security_report['warnings'].append(message)
+            if security_report['risk_level'] == 'LOW':
+                security_report['risk_level'] = 'MEDIUM'
+
+        def _block(message: str):
+            security_report['safe'] = False
+            security_report['blocked_items'].append(message)
+            security_report['risk_level'] = 'HIGH'
+
+        # Hoist attribute lookups out of the walk loop - these run once per
+        # AST node on every submission
+        blocked_set = self._blocked_set
+        allowed_set = self._allowed_set
+        file_system_access = self.config.file_system_access
+        Call, Name, Attribute = ast.Call, ast.Name, ast.Attribute
+        Import, ImportFrom = ast.Import, ast.ImportFrom
+
+        for node in ast.walk(tree):
+            if isinstance(node, Call):
+                func = node.func
+                if isinstance(func, Name):
+                    if func.id in blocked_set:
+                        _block(f"Blocked function: {func.id}")
+                    elif func.id in SUSPICIOUS_BUILTINS:
+                        _warn(f"Suspicious pattern: {func.id}")
+                elif isinstance(func, Attribute):
+                    if isinstance(func.value, Name):
+                        dotted = f"{func.value.id}.{func.attr}"
+                        if dotted in SUSPICIOUS_CALLS:
+                            _warn(f"Suspicious pattern: {dotted}")
+                    if func.attr in FILE_OP_METHODS and not file_system_access:
+                        _block(f"File operation: {func.attr}()")
+
+            elif isinstance(node, Import):
+                for alias in node.names:
+                    module = alias.name.split('.')[0]
+                    if module not in allowed_set:
+                        _warn(f"Unauthorized import: {module}")
+
+            elif isinstance(node, ImportFrom):
+                module = (node.module or '').split('.')[0]
+                if module and module not in allowed_set:
+                    _warn(f"Unauthorized import: {module}")
+
+            elif isinstance(node, Name):
+                if node.id in SUSPICIOUS_NAMES:
+                    _warn(f"Suspicious pattern: {node.id}")
+
         return security_report
     
+    def _cpu_percent(self, session_id: str, cpu_seconds: float) -> float:
+        """CPU%% from our own (cpu_time, wall_time) baseline per session.
+
+        psutil's no-interval cpu_percent() returns 0.0 until a second
+        snapshot exists, silently under-triggering the CPU violation check;
+        the interval= variant blocks. One subtraction against the stored
+        baseline gives an accurate figure on every tick after the first.
+        """
+        monitor = self.resource_monitors.setdefault(session_id, {'violations': Counter()})
+        now = time.monotonic()
+        last_cpu = monitor.get('last_cpu_seconds')
+        last_wall = monitor.get('last_wall')
+        monitor['last_cpu_seconds'] = cpu_seconds
+        monitor['last_wall'] = now
+
+        if last_cpu is None or now <= last_wall:
+            return 0.0
+        return (cpu_seconds - last_cpu) / (now - last_wall) * 100.0 / _NUM_CPUS
+
+    @staticmethod
+    def _fast_proc_read(pid: int) -> tuple:
+        """Read cpu seconds, rss bytes and fd count straight from /proc.
+
+        Two file reads + one listdir replace the four psutil calls in the
+        monitoring hot path; psutil re-opens a /proc file per attribute and
+        assembles namedtuples we immediately discard. rsplit on b') ' skips
+        past the comm field, which may itself contain ')' characters.
+        """
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            fields = f.read().rsplit(b') ', 1)[1].split()
+        # fields are 0-indexed from 'state'; utime/stime are stat fields 14/15
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / _CLK_TCK
+        with open(f'/proc/{pid}/statm', 'rb') as f:
+            rss_bytes = int(f.read().split()[1]) * _PAGESIZE
+        try:
+            num_fds = len(os.listdir(f'/proc/{pid}/fd'))
+        except OSError:
+            num_fds = 0
+        return cpu_seconds, rss_bytes, num_fds
+
+    @staticmethod
+    def _net_connection_count(pid: int) -> int:
+        """Count a process's sockets by its socket fds.
+
+        psutil's connections() cross-references every socket on the system
+        against the process's fds - an O(total-sockets) scan per call. The
+        violation check only needs a count, and each socket fd shows up as
+        a "socket:[inode]" symlink under /proc/<pid>/fd, so one listdir
+        plus readlinks gives it. (/proc/<pid>/net/tcp is NOT usable here:
+        it is per-network-namespace and lists the whole host's sockets, so
+        an idle child would inherit the server's own connections and trip
+        the network violation instantly.)
+        """
+        fd_dir = f'/proc/{pid}/fd'
+        count = 0
+        try:
+            for fd in os.listdir(fd_dir):
+                try:
+                    if os.readlink(f'{fd_dir}/{fd}').startswith('socket:'):
+                        count += 1
+                except OSError:
+                    # fd closed between listdir and readlink
+                    pass
+        except OSError:
+            pass
+        return count
+
+    def _read_psi(self, resource_name: str) -> Optional[float]:
+        """Read the kernel's 10s pressure average for cpu/memory/io.
+
+        On Linux >= 4.20 /proc/pressure/* exposes stall percentages the
+        kernel already aggregates, so one 3-file read replaces a psutil
+        sweep over every tracked process. Returns None when PSI is
+        unavailable (non-Linux or old kernels).
+        """
+        try:
+            with open(f'/proc/pressure/{resource_name}') as f:
+                for line in f:
+                    if line.startswith('some'):
+                        # e.g. "some avg10=0.00 avg60=0.00 avg300=0.00 total=0"
+                        return float(line.split('avg10=')[1].split()[0])
+        except (OSError, IndexError, ValueError):
+            pass
+        return None
+
+    def get_system_pressure(self) -> Optional[Dict[str, float]]:
+        """Aggregate cpu/memory/io pressure in O(1), independent of session count"""
+        cpu = self._read_psi('cpu')
+        if cpu is None:
+            return None
+        return {
+            'cpu': cpu,
+            'memory': self._read_psi('memory') or 0.0,
+            'io': self._read_psi('io') or 0.0
+        }
+
+    def next_poll_interval(self) -> float:
+        """Adaptive interval for the outer monitoring loop.
+
+        Bounded-linear backoff: poll every 100ms while few sessions are
+        active, stretch linearly to 1s at 500+ sessions so the aggregate
+        syscall rate stays bounded as concurrency grows. Callers should
+        sleep this long between monitor_execution sweeps.
+        """
+        n = len(self.active_processes)
+        if n <= 50:
+            return 0.1
+        if n >= 500:
+            return 1.0
+        return 0.1 + (n - 50) * 0.9 / 450
+
     def monitor_execution(self, session_id: str, process: psutil.Process) -> ResourceUsage:
         """Monitor resource usage during execution"""
         self.active_processes[session_id] = process
         
         try:
-            # Get process info
-            cpu_percent = process.cpu_percent()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
-            
-            # Get open files count
-            try:
-                open_files = len(process.open_files())
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                open_files = 0
-            
+            if _HAS_PROC:
+                # Linux fast path: two /proc reads + one listdir instead of
+                # a psutil call per attribute
+                try:
+                    cpu_seconds, rss_bytes, open_files = self._fast_proc_read(process.pid)
+                except OSError:
+                    raise psutil.NoSuchProcess(process.pid)
+                memory_mb = rss_bytes / (1024 * 1024)
+                cpu_percent = self._cpu_percent(session_id, cpu_seconds)
+                create_time = process.create_time()
+            else:
+                # oneshot() batches the underlying reads across these calls
+                with process.oneshot():
+                    cpu_times = process.cpu_times()
+                    memory_info = process.memory_info()
+                    memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
+                    create_time = process.create_time()
+                cpu_percent = self._cpu_percent(
+                    session_id, cpu_times.user + cpu_times.system
+                )
+
+                # Get open files count
+                try:
+                    open_files = len(process.open_files())
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    open_files = 0
+
             # Get network connections count
-            try:
-                network_connections = len(process.connections())
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                network_connections = 0
-            
+            if _HAS_PROC:
+                network_connections = self._net_connection_count(process.pid)
+            else:
+                try:
+                    network_connections = len(process.connections())
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    network_connections = 0
+
             # Get disk I/O
             try:
                 io_counters = process.io_counters()
@@ -172,9 +465,8 @@ class SecurityManager:
                 disk_io_write = io_counters.write_bytes
             except (psutil.AccessDenied, psutil.NoSuchProcess):
                 disk_io_read = disk_io_write = 0
-            
+
             # Calculate execution time
-            create_time = process.create_time()
             execution_time = time.time() - create_time
             
             usage = ResourceUsage(
@@ -187,9 +479,14 @@ class SecurityManager:
                 disk_io_write=disk_io_write
             )
             
+            # Publish the sample into the SoA metric arrays
+            slot = self._acquire_slot(session_id, process.pid)
+            self._mem_mb[slot] = memory_mb
+            self._cpu[slot] = cpu_percent
+
             # Check for violations
             self._check_resource_violations(session_id, usage)
-            
+
             return usage
             
         except psutil.NoSuchProcess:
@@ -215,6 +512,7 @@ class SecurityManager:
                 
                 logger.warning(f"🛑 Terminated session {session_id}: {reason}")
                 del self.active_processes[session_id]
+                self._release_slot(session_id)
                 
             except Exception as e:
                 logger.error(f"❌ Error terminating session {session_id}: {e}")
@@ -224,20 +522,24 @@ class SecurityManager:
         if session_id in self.active_processes:
             del self.active_processes[session_id]
         
-        if session_id in self.resource_monitors:
-            del self.resource_monitors[session_id]
-        
-        # Clear any remaining signal alarms
-        signal.alarm(0)
+        monitor = self.resource_monitors.pop(session_id, None)
+        if monitor is not None:
+            timer = monitor.get('timer')
+            if timer is not None:
+                timer.cancel()
+
+        self._release_slot(session_id)
     
     def get_security_report(self) -> Dict[str, Any]:
         """Get comprehensive security report"""
+        # Aggregates come straight from the SoA arrays written during
+        # monitor_execution - no psutil syscalls from a pure reporting call
+        total_mem_mb = float(self._mem_mb[self._active_mask].sum())
+
         return {
             'active_sessions': len(self.active_processes),
-            'total_memory_usage': sum(
-                self.monitor_execution(sid, proc).memory_mb 
-                for sid, proc in self.active_processes.items()
-            ),
+            'total_memory_usage': total_mem_mb,
+            'system_pressure': self.get_system_pressure(),
             'security_config': {
                 'max_memory_mb': self.config.max_memory_mb,
                 'max_execution_time': self.config.max_execution_time,
@@ -246,7 +548,7 @@ class SecurityManager:
                 'file_system_access': self.config.file_system_access
             },
             'violations_detected': sum(
-                len(monitor.get('violations', [])) 
+                sum(monitor.get('violations', Counter()).values())
                 for monitor in self.resource_monitors.values()
             )
         }
@@ -295,61 +597,72 @@ class SecurityManager:
         
         return restricted_env
     
-    def _extract_module_name(self, import_line: str) -> Optional[str]:
-        """Extract module name from import statement"""
-        try:
-            if import_line.startswith('import '):
-                module = import_line[7:].split()[0].split('.')[0]
-                return module
-            elif import_line.startswith('from '):
-                module = import_line[5:].split()[0].split('.')[0]
-                return module
-        except Exception:
-            pass
-        return None
-    
+    def format_violations(self, session_id: str) -> List[str]:
+        """Render a session's violation counters as human-readable lines"""
+        monitor = self.resource_monitors.get(session_id)
+        if not monitor:
+            return []
+        worst = monitor.get('worst_values', {})
+        limits = {
+            ViolationKind.MEMORY: self.config.max_memory_mb,
+            ViolationKind.CPU: self.config.max_cpu_percent,
+            ViolationKind.TIME: self.config.max_execution_time,
+            ViolationKind.FILES: self.config.max_open_files,
+            ViolationKind.NETWORK: 0,
+        }
+        return [
+            _VIOLATION_TEMPLATES[kind].format(value=worst.get(kind, 0.0), limit=limits[kind])
+            + (f" x{count}" if count > 1 else "")
+            for kind, count in monitor['violations'].items()
+        ]
+
     def _check_resource_violations(self, session_id: str, usage: ResourceUsage):
         """Check for resource limit violations"""
-        violations = []
-        
-        # Memory check
+        # (kind, observed value) pairs - a long-running violator used to
+        # append a freshly formatted string on every tick; counters plus a
+        # worst-observed value keep the log constant-size per kind
+        hits = []
+
         if usage.memory_mb > self.config.max_memory_mb:
-            violations.append(f"Memory usage ({usage.memory_mb:.1f}MB) exceeds limit ({self.config.max_memory_mb}MB)")
-        
-        # CPU check
+            hits.append((ViolationKind.MEMORY, usage.memory_mb))
+
         if usage.cpu_percent > self.config.max_cpu_percent:
-            violations.append(f"CPU usage ({usage.cpu_percent:.1f}%) exceeds limit ({self.config.max_cpu_percent}%)")
-        
-        # Execution time check
+            hits.append((ViolationKind.CPU, usage.cpu_percent))
+
         if usage.execution_time > self.config.max_execution_time:
-            violations.append(f"Execution time ({usage.execution_time:.1f}s) exceeds limit ({self.config.max_execution_time}s)")
-        
-        # File descriptor check
+            hits.append((ViolationKind.TIME, usage.execution_time))
+
         if usage.open_files > self.config.max_open_files:
-            violations.append(f"Open files ({usage.open_files}) exceeds limit ({self.config.max_open_files})")
-        
-        # Network check
+            hits.append((ViolationKind.FILES, float(usage.open_files)))
+
         if not self.config.network_access and usage.network_connections > 0:
-            violations.append(f"Unauthorized network connections detected ({usage.network_connections})")
-        
-        if violations:
-            # Store violations for reporting
-            if session_id not in self.resource_monitors:
-                self.resource_monitors[session_id] = {'violations': []}
-            
-            self.resource_monitors[session_id]['violations'].extend(violations)
-            
-            # Terminate for critical violations
-            critical_violations = ['Memory usage', 'Execution time', 'Unauthorized network']
-            for violation in violations:
-                if any(critical in violation for critical in critical_violations):
-                    self.terminate_execution(session_id, f"Security violation: {violation}")
+            hits.append((ViolationKind.NETWORK, float(usage.network_connections)))
+
+        if hits:
+            monitor = self.resource_monitors.setdefault(session_id, {'violations': Counter()})
+            counter = monitor['violations']
+            worst = monitor.setdefault('worst_values', {})
+            for kind, value in hits:
+                counter[kind] += 1
+                worst[kind] = max(worst.get(kind, value), value)
+
+            slot = self._session_slots.get(session_id)
+            if slot is not None:
+                self._viol_count[slot] += len(hits)
+
+            # Terminate for critical violations - format only the one
+            # message that actually gets logged
+            for kind, value in hits:
+                if kind in CRITICAL_VIOLATIONS:
+                    limit = {
+                        ViolationKind.MEMORY: self.config.max_memory_mb,
+                        ViolationKind.TIME: self.config.max_execution_time,
+                        ViolationKind.NETWORK: 0,
+                    }[kind]
+                    message = _VIOLATION_TEMPLATES[kind].format(value=value, limit=limit)
+                    self.terminate_execution(session_id, f"Security violation: {message}")
                     break
     
-    def _timeout_handler(self, signum, frame):
-        """Handle execution timeout"""
-        raise TimeoutError("Algorithm execution timed out")
-
 class SecurityError(Exception):
     """Custom exception for security-related errors"""
     pass
@@ -1,6 +1,13 @@
 # Real Testing Framework Implementation
 # /backend/testing/real_test_executor.py
 
+import asyncio
+import io
+import os
+import py_compile
+import sys
+import tarfile
+import string
 import pytest
 import unittest
 import subprocess
@@ -9,9 +16,68 @@ import json
 from typing import Dict, List, Any
 from dataclasses import dataclass
 import time
+import logging
 import psutil
 import docker
 
+logger = logging.getLogger(__name__)
+
+# C-implemented JSON when available - parsing PERF_DATA lines and dumping
+# one frame per test result are both on the hot path
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_loads(data):
+        return json.loads(data)
+
+# Compiled once at import - $user_code and $body are the only substitution
+# points, so the PERF_DATA line is written literally instead of through an
+# f-string full of brace/backslash escaping rebuilt on every request
+TEST_FILE_TEMPLATE = string.Template('''
+import pytest
+import resource
+import sys
+import time
+from typing import List
+
+# User's algorithm implementation
+${user_code}
+
+class TestAlgorithm:
+
+    def setup_method(self):
+        """Setup before each test"""
+        # One getrusage read instead of tracemalloc, whose allocator hook
+        # slows every allocation in the tested code 2-3x and would distort
+        # the performance assertions
+        self._start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        self.start_time = time.perf_counter()
+
+    def teardown_method(self):
+        """Cleanup after each test"""
+        self.execution_time = time.perf_counter() - self.start_time
+        rss_delta = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - self._start_rss
+        # ru_maxrss is KB on Linux, bytes on macOS
+        if sys.platform == 'darwin':
+            self.memory_usage = rss_delta / (1024 * 1024)
+        else:
+            self.memory_usage = rss_delta / 1024
+
+        # Log performance data
+        print(f'PERF_DATA: {{"time": {self.execution_time}, "memory": {self.memory_usage}}}')
+
+${body}
+''')
+
 @dataclass
 class TestResult:
     test_name: str
@@ -28,61 +94,155 @@ class RealTestExecutor:
     This runs REAL tests, not simulated ones
     """
     
-    def __init__(self):
+    POOL_IMAGE = "algorithm-tester:latest"
+
+    def __init__(self, pool_size: int = 0):
         self.docker_client = docker.from_env()
         self.test_templates = {
             'two_sum': self._load_two_sum_tests(),
             'binary_search': self._load_binary_search_tests(),
             'container_water': self._load_container_water_tests()
         }
-    
+        # Warm container pool - amortizes container start + pip install
+        # across all runs; empty until start_pool() is awaited
+        self.pool_size = pool_size
+        self._pool: asyncio.Queue = asyncio.Queue()
+        self._pool_containers: List[Any] = []
+
+    async def start_pool(self, size: int = None):
+        """Launch pre-warmed test containers (pytest already installed)"""
+        size = size or self.pool_size
+        for i in range(size):
+            container = await asyncio.to_thread(
+                self.docker_client.containers.run,
+                self.POOL_IMAGE,
+                command="sleep infinity",
+                detach=True,
+                mem_limit="512m",
+                cpu_quota=50000,
+                name=f"test-pool-{i}",
+                labels={"type": "test-pool"}
+            )
+            self._pool_containers.append(container)
+            await self._pool.put(container)
+
+    async def shutdown_pool(self):
+        """Stop and remove all pooled containers"""
+        for container in self._pool_containers:
+            try:
+                await asyncio.to_thread(container.remove, force=True)
+            except Exception:
+                pass
+        self._pool_containers.clear()
+        self._pool = asyncio.Queue()
+
+    async def _acquire(self):
+        """Take a warm container from the pool (waits if all are busy)"""
+        return await self._pool.get()
+
+    async def _release(self, container):
+        """Return a container to the pool"""
+        await self._pool.put(container)
+
     async def run_real_tests(self, algorithm_name: str, user_code: str) -> List[TestResult]:
         """Execute real unit tests in isolated Docker container"""
-        
+
         # Create test file with user's code
         test_file_content = self._generate_test_file(algorithm_name, user_code)
-        
-        # Run tests in Docker container
-        container_result = await self._run_tests_in_container(test_file_content)
-        
+
+        # Dispatch to a warm container when the pool is running; the cold
+        # docker-run path stays as the fallback
+        if self._pool_containers:
+            container = await self._acquire()
+            try:
+                container_result = await asyncio.to_thread(
+                    self._exec_tests_in_pooled, container, test_file_content
+                )
+            finally:
+                await self._release(container)
+        else:
+            container_result = await self._run_tests_in_container(test_file_content)
+
         # Parse results
         return self._parse_test_results(container_result)
-    
-    def _generate_test_file(self, algorithm_name: str, user_code: str) -> str:
-        """Generate actual pytest file with user's code"""
-        
-        test_template = self.test_templates[algorithm_name]
-        
-        # Create complete test file
-        test_file = f"""
-import pytest
-import time
-import tracemalloc
-from typing import List
 
-# User's algorithm implementation
-{user_code}
+    def _exec_tests_in_pooled(self, container, test_file_content: str) -> dict:
+        """Exec pytest inside a warm pooled container (~50ms vs multi-second cold start)"""
+        # Ship the test file in as an in-memory tar archive
+        data = test_file_content.encode('utf-8')
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w') as tar:
+            info = tarfile.TarInfo(name='test_algorithm.py')
+            info.size = len(data)
+            # Owned by tester (uid/gid 1000 in the image), not root -
+            # the container user must be able to wipe it afterwards
+            info.uid = info.gid = 1000
+            info.uname = info.gname = 'tester'
+            tar.addfile(info, io.BytesIO(data))
+        # /app/tests is created tester-owned by the image; the pooled
+        # container runs as tester, who cannot mkdir under /
+        container.put_archive('/app/tests', buf.getvalue())
 
-class TestAlgorithm:
-    
-    def setup_method(self):
-        \"\"\"Setup before each test\"\"\"
-        tracemalloc.start()
-        self.start_time = time.perf_counter()
-    
-    def teardown_method(self):
-        \"\"\"Cleanup after each test\"\"\"
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        self.execution_time = time.perf_counter() - self.start_time
-        self.memory_usage = peak / 1024 / 1024  # MB
-        
-        # Log performance data
-        print(f"PERF_DATA: {{\\\"time\\\": {self.execution_time}, \\\"memory\\\": {self.memory_usage}}}")
+        # Stream the exec output and scan each complete line as it arrives
+        # instead of materializing the whole log and split('\n')-ing it later
+        api = container.client.api
+        exec_id = api.exec_create(
+            container.id,
+            ["python", "-m", "pytest", "/app/tests/test_algorithm.py", "-v",
+             "--tb=short", "--json-report", "--json-report-file=/app/tests/results.json"],
+            workdir="/app/tests"
+        )['Id']
+
+        buffer = bytearray()
+        log_lines = []
+        perf_data = {}
+        for chunk in api.exec_start(exec_id, stream=True):
+            buffer.extend(chunk)
+            while True:
+                newline = buffer.find(b'\n')
+                if newline < 0:
+                    break
+                line = bytes(buffer[:newline])
+                del buffer[:newline + 1]
+                log_lines.append(line)
+                marker = line.find(b'PERF_DATA:')
+                if marker >= 0:
+                    try:
+                        perf_data = _json_loads(line[marker + 10:])
+                    except ValueError:
+                        pass
+        if buffer:
+            log_lines.append(bytes(buffer))
+
+        exit_code = api.exec_inspect(exec_id).get('ExitCode', -1)
+        logs = b'\n'.join(log_lines).decode('utf-8', errors='replace')
+
+        json_results = {}
+        results_code, results_raw = container.exec_run(["cat", "/app/tests/results.json"])
+        if results_code == 0:
+            try:
+                json_results = _json_loads(results_raw)
+            except ValueError:
+                pass
+
+        # Wipe the workspace so runs can't see each other's files
+        wipe_code, _ = container.exec_run(["sh", "-c", "rm -rf /app/tests/*"])
+        if wipe_code != 0:
+            logger.warning(f"⚠️ Pooled workspace wipe failed (exit {wipe_code})")
+
+        return {
+            'exit_code': exit_code,
+            'logs': logs,
+            'json_results': json_results,
+            'perf_data': perf_data
+        }
 
-{test_template}
-"""
-        return test_file
+    def _generate_test_file(self, algorithm_name: str, user_code: str) -> str:
+        """Generate actual pytest file with user's code"""
+        return TEST_FILE_TEMPLATE.substitute(
+            user_code=user_code,
+            body=self.test_templates[algorithm_name]
+        )
     
     def _load_two_sum_tests(self) -> str:
         """Load Two Sum test cases"""
@@ -140,48 +300,70 @@ class TestAlgorithm:
 '''
     
     async def _run_tests_in_container(self, test_file_content: str) -> dict:
-        """Run tests in isolated Docker container"""
-        
+        """Run tests in isolated Docker container without blocking the event loop"""
+
+        # containers.run / wait / logs are synchronous HTTP calls to the
+        # Docker daemon - run the whole blocking sequence in a worker thread
+        # so one stuck container can't starve other sessions' handlers
+        return await asyncio.to_thread(self._run_tests_blocking, test_file_content)
+
+    def _run_tests_blocking(self, test_file_content: str) -> dict:
+        """Synchronous container run - executed via asyncio.to_thread"""
+
         # Create temporary directory with test file
         with tempfile.TemporaryDirectory() as temp_dir:
             test_file_path = f"{temp_dir}/test_algorithm.py"
             with open(test_file_path, 'w') as f:
                 f.write(test_file_content)
-            
+
+            # Precompile on the host so the container's Python skips
+            # lex/parse/compile for the harness + user code; only valid when
+            # the host bytecode format matches the container's 3.11
+            if sys.version_info[:2] == (3, 11):
+                try:
+                    py_compile.compile(
+                        test_file_path,
+                        cfile=f"{temp_dir}/__pycache__/test_algorithm.cpython-311.pyc",
+                        doraise=True
+                    )
+                except py_compile.PyCompileError:
+                    pass  # syntax errors surface properly inside the container
+
             # Run pytest in Docker container
             container = self.docker_client.containers.run(
                 "python:3.11-slim",
                 command=[
-                    "sh", "-c", 
+                    "sh", "-c",
                     "pip install pytest && cd /tests && python -m pytest test_algorithm.py -v --tb=short --json-report --json-report-file=results.json"
                 ],
                 volumes={temp_dir: {'bind': '/tests', 'mode': 'rw'}},
                 working_dir="/tests",
+                environment={"PYTHONDONTWRITEBYTECODE": "1"},
                 detach=True,
                 mem_limit="512m",  # Memory limit
                 cpu_quota=50000,   # CPU limit
                 remove=True
             )
-            
+
             # Wait for completion with timeout
             try:
                 result = container.wait(timeout=30)
                 logs = container.logs().decode('utf-8')
-                
+
                 # Read JSON results if available
                 results_file = f"{temp_dir}/results.json"
                 if os.path.exists(results_file):
-                    with open(results_file, 'r') as f:
-                        json_results = json.load(f)
+                    with open(results_file, 'rb') as f:
+                        json_results = _json_loads(f.read())
                 else:
                     json_results = {}
-                
+
                 return {
                     'exit_code': result['StatusCode'],
                     'logs': logs,
                     'json_results': json_results
                 }
-                
+
             except Exception as e:
                 container.kill()
                 return {
@@ -197,15 +379,17 @@ class TestAlgorithm:
         logs = container_result['logs']
         json_results = container_result.get('json_results', {})
         
-        # Parse performance data from logs
-        perf_data = {}
-        for line in logs.split('\n'):
-            if 'PERF_DATA:' in line:
-                try:
-                    perf_json = line.split('PERF_DATA:')[1].strip()
-                    perf_data = json.loads(perf_json)
-                except:
-                    pass
+        # Pooled runs already extracted perf data while streaming; only the
+        # cold path still needs the full-log scan
+        perf_data = container_result.get('perf_data') or {}
+        if not perf_data:
+            for line in logs.split('\n'):
+                if 'PERF_DATA:' in line:
+                    try:
+                        perf_json = line.split('PERF_DATA:')[1].strip()
+                        perf_data = _json_loads(perf_json)
+                    except:
+                        pass
         
         # Parse pytest JSON results
         if 'tests' in json_results:
@@ -247,7 +431,7 @@ class RealTimeTestHandler:
         user_code = message.get('user_code')
         
         # Start test execution
-        await websocket.send(json.dumps({
+        await websocket.send(_json_dumps({
             'type': 'TEST_STARTED',
             'session_id': session_id,
             'message': f'Starting tests for {algorithm_name}...'
@@ -259,7 +443,7 @@ class RealTimeTestHandler:
             
             # Stream results back
             for result in test_results:
-                await websocket.send(json.dumps({
+                await websocket.send(_json_dumps({
                     'type': 'TEST_RESULT',
                     'session_id': session_id,
                     'test_name': result.test_name,
@@ -270,7 +454,7 @@ class RealTimeTestHandler:
                 }))
             
             # Send completion
-            await websocket.send(json.dumps({
+            await websocket.send(_json_dumps({
                 'type': 'TEST_COMPLETED',
                 'session_id': session_id,
                 'total_tests': len(test_results),
@@ -279,7 +463,7 @@ class RealTimeTestHandler:
             }))
             
         except Exception as e:
-            await websocket.send(json.dumps({
+            await websocket.send(_json_dumps({
                 'type': 'TEST_ERROR',
                 'session_id': session_id,
                 'error': str(e)
@@ -4,10 +4,18 @@
 Docker-based pytest execution with comprehensive test suites and benchmarking
 """
 
+import asyncio
 import docker
-import tempfile
+import hashlib
+import io
+import queue
+import tarfile
+import threading
 import os
 import json
+import resource
+import shutil
+import tempfile
 import yaml
 import time
 from typing import Dict, List, Any, Optional
@@ -18,7 +26,46 @@ import subprocess
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Streaming JSON parser - long suites produce report files with hundreds
+# of records and long tracebacks; streaming caps parser memory at one
+# record instead of materializing the whole document
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _iter_report_items(raw: bytes, prefix: str):
+    """Yield records from a pytest report JSON, streaming when possible"""
+    if ijson is not None:
+        yield from ijson.items(io.BytesIO(raw), prefix + '.item')
+    else:
+        yield from _json_loads(raw).get(prefix, [])
+
+# Image setup is amortized across all TestFramework instances in this
+# process - the flag skips the daemon round-trip once the image is known
+# to exist, the lock keeps concurrent constructors from racing the build
+_image_ready = False
+_image_lock = threading.Lock()
+
+# C-implemented serializer for the test payloads when available - the
+# large_array cases re-serialize range(10000) lists otherwise
+try:
+    import orjson
+
+    def _dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+    def _json_loads(data):
+        return json.loads(data)
+
+@dataclass(slots=True)
 class TestCase:
     """Individual test case definition"""
     name: str
@@ -28,8 +75,11 @@ class TestCase:
     memory_limit: int = 128  # MB
     description: str = ""
     tags: List[str] = None
+    # Serialized once on suite registration and reused on every generation
+    input_json: str = ""
+    expected_json: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     """Test suite definition"""
     name: str
@@ -39,7 +89,7 @@ class TestSuite:
     teardown_code: str = ""
     benchmarks: List[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Individual test result"""
     test_name: str
@@ -51,7 +101,7 @@ class TestResult:
     expected: Any
     actual: Any
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Benchmark test result"""
     name: str
@@ -61,7 +111,7 @@ class BenchmarkResult:
     throughput: float
     percentiles: Dict[str, float]
 
-@dataclass
+@dataclass(slots=True)
 class TestSuiteResult:
     """Complete test suite result"""
     suite_name: str
@@ -78,14 +128,151 @@ class TestSuiteResult:
 class TestFramework:
     """Docker-based testing framework"""
     
-    def __init__(self):
-        self.docker_client = docker.from_env()
+    # Two sequential pytest passes shared by the cold-container,
+    # warm-runner and subprocess paths. Coverage and benchmarks used to
+    # share one run, but coverage.py instruments every line via
+    # sys.settrace and slowed the benchmarked functions 2-10x; the
+    # benchmark pass now runs clean with the cov plugin off.
+    # -q instead of -v throughout: per-test result lines are nontrivial
+    # I/O for tests that finish in microseconds. loadscope keeps every
+    # test of one algorithm on the same xdist worker so its module
+    # imports once.
+    COVERAGE_PASS = (
+        "pytest --tb=short -q -n auto --dist=loadscope -m 'not benchmark' "
+        "--cov={algorithm_name} --cov-report=json:coverage.json "
+        "--json-report --json-report-file=test_results.json"
+    )
+    BENCHMARK_PASS = (
+        "pytest --tb=short -q --benchmark-only -p no:cov "
+        "--benchmark-disable-gc --benchmark-json=benchmark_results.json"
+    )
+
+    # Call shapes resolved once at generation time - the generated test,
+    # benchmark and security bodies contain a single direct call instead of
+    # an if/elif ladder of string comparisons evaluated inside the container
+    _CALL_TEMPLATES = {
+        "two_sum": "{fn}(input_data['nums'], input_data['target'])",
+        "binary_search": "{fn}(input_data['arr'], input_data['target'])",
+        "max_area": "{fn}(input_data['height'])",
+    }
+    _BENCH_DATA_TEMPLATES = {
+        "two_sum": "test_data = {'nums': list(range(input_size)), 'target': input_size * 2 - 3}",
+        "binary_search": "test_data = {'arr': list(range(input_size)), 'target': input_size // 2}",
+        "max_area": "test_data = {'height': [i % 100 for i in range(input_size)]}",
+    }
+    _BENCH_CALL_TEMPLATES = {
+        "two_sum": "benchmark({fn}, test_data['nums'], test_data['target'])",
+        "binary_search": "benchmark({fn}, test_data['arr'], test_data['target'])",
+        "max_area": "benchmark({fn}, test_data['height'])",
+    }
+    _BENCH_ARGS_TEMPLATES = {
+        "two_sum": "(test_data['nums'], test_data['target'])",
+        "binary_search": "(test_data['arr'], test_data['target'])",
+        "max_area": "(test_data['height'],)",
+    }
+    _SECURITY_LARGE_TEMPLATES = {
+        "two_sum": "result = {fn}(list(range(100000)), 199999)",
+        "binary_search": "result = {fn}(list(range(100000)), 50000)",
+    }
+    _SECURITY_EDGE_TEMPLATES = {
+        "two_sum": (
+            "# Empty array, then single element - neither has a valid pair\n"
+            "            assert {fn}([], 0) == []\n"
+            "            assert {fn}([1], 1) == []"
+        ),
+        "binary_search": "assert {fn}([], 1) == -1",
+    }
+
+    def __init__(self, runner_pool_size: int = 0, sandbox_mode: str = "docker"):
+        # "docker" runs suites in containers; "subprocess" runs trusted
+        # pure-Python suites under firejail/rlimits, skipping the ~1s
+        # per-run container tax entirely
+        self.sandbox_mode = sandbox_mode
+        self.docker_client = docker.from_env() if sandbox_mode == "docker" else None
         self.test_suites: Dict[str, TestSuite] = {}
-        self._setup_test_image()
+        self._runner_pool: queue.Queue = queue.Queue()
+        self._runner_containers: List[Any] = []
+        # Generated test content is static per registered suite, and the
+        # full tar bundle only varies with the submitted code - cache both
+        # so repeat runs during user iteration skip regeneration
+        self._test_content_cache: Dict[str, str] = {}
+        self._archive_cache: Dict[str, bytes] = {}
+        if sandbox_mode == "docker":
+            self._setup_test_image()
         self._load_algorithm_test_suites()
+        if runner_pool_size and sandbox_mode == "docker":
+            self.start_runner_pool(runner_pool_size)
+
+    def start_runner_pool(self, size: int = 2):
+        """Launch long-lived runner containers to amortize container start.
+
+        Each run_test_suite call paid the full container cold-start; warm
+        runners sleep between suites and execute pytest via exec_run against
+        a tmpfs workspace instead.
+        """
+        for i in range(size):
+            container = self.docker_client.containers.run(
+                "algorithm-tester:latest",
+                command=["sleep", "infinity"],
+                tmpfs={"/app/tests": "rw,size=64m"},
+                working_dir="/app/tests",
+                mem_limit="256m",
+                cpu_quota=400000,
+                cpu_period=100000,
+                network_disabled=True,
+                user="tester",
+                detach=True,
+                name=f"test-runner-{i}",
+                labels={"type": "test-runner"}
+            )
+            self._runner_containers.append(container)
+            self._runner_pool.put(container)
+        logger.info(f"🔥 Started {size} warm test runner containers")
+
+    def shutdown_runner_pool(self):
+        """Stop and remove all pooled runner containers"""
+        for container in self._runner_containers:
+            try:
+                container.remove(force=True)
+            except Exception:
+                pass
+        self._runner_containers.clear()
+        self._runner_pool = queue.Queue()
+
+    def _acquire_runner(self, timeout: float = None):
+        """Take a warm runner from the pool (blocks while all are busy)"""
+        return self._runner_pool.get(timeout=timeout)
+
+    def _release_runner(self, container):
+        """Wipe the runner's workspace and return it to the pool"""
+        try:
+            # put_archive extracts members root-owned, so the wipe must run
+            # as root - as "tester" every delete fails with EPERM and stale
+            # test_*.py files leak into the next suite's pytest collection
+            exit_code, _ = container.exec_run(
+                ["find", "/app/tests", "-mindepth", "1", "-delete"],
+                user="root"
+            )
+            if exit_code != 0:
+                logger.warning(f"⚠️ Runner workspace wipe failed (exit {exit_code})")
+        finally:
+            self._runner_pool.put(container)
     
     def _setup_test_image(self):
-        """Setup Docker image for testing"""
+        """Setup Docker image for testing (once per process)"""
+        global _image_ready
+
+        if _image_ready:
+            return
+
+        with _image_lock:
+            if _image_ready:
+                return
+            self._ensure_test_image()
+            _image_ready = True
+
+    def _ensure_test_image(self):
+        """Check for the test image and build it if missing"""
         dockerfile_content = """
 FROM python:3.11-slim
 
@@ -107,6 +294,7 @@ RUN pip install --no-cache-dir \\
     memory-profiler==0.61.0 \\
     psutil==5.9.6 \\
     numpy==1.25.2 \\
+    numba==0.59.1 \\
     coverage==7.3.2
 
 # Create test user
@@ -125,21 +313,15 @@ CMD ["pytest", "--tb=short", "-v"]
             logger.info("📦 Using existing Docker test image")
         except docker.errors.ImageNotFound:
             logger.info("🔨 Building Docker test image...")
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.dockerfile', delete=False) as f:
-                f.write(dockerfile_content)
-                dockerfile_path = f.name
-            
-            try:
-                image, logs = self.docker_client.images.build(
-                    path=os.path.dirname(dockerfile_path),
-                    dockerfile=os.path.basename(dockerfile_path),
-                    tag="algorithm-tester:latest",
-                    rm=True
-                )
-                logger.info("✅ Docker test image built successfully")
-            finally:
-                os.unlink(dockerfile_path)
+
+            # Feed the dockerfile straight from memory - no temp file to
+            # write and unlink on the host
+            image, logs = self.docker_client.images.build(
+                fileobj=io.BytesIO(dockerfile_content.encode('utf-8')),
+                tag="algorithm-tester:latest",
+                rm=True
+            )
+            logger.info("✅ Docker test image built successfully")
     
     def _load_algorithm_test_suites(self):
         """Load predefined test suites for algorithms"""
@@ -202,6 +384,17 @@ CMD ["pytest", "--tb=short", "-v"]
             "binary_search": binary_search_suite,
             "container_water": container_water_suite
         }
+
+        for suite in self.test_suites.values():
+            self._serialize_test_payloads(suite)
+
+    @staticmethod
+    def _serialize_test_payloads(suite: TestSuite):
+        """Cache each case's JSON form so generation never re-serializes it"""
+        for test_case in suite.test_cases:
+            if not test_case.input_json:
+                test_case.input_json = _dumps_compact(test_case.input_data)
+                test_case.expected_json = _dumps_compact(test_case.expected_output)
     
     def run_test_suite(
         self, 
@@ -219,23 +412,35 @@ CMD ["pytest", "--tb=short", "-v"]
             algorithm_name=algorithm_name,
             test_cases=custom_test_cases
         )
+        self._serialize_test_payloads(suite)
         
-        temp_dir = None
         container = None
-        
+
         try:
-            # Create temporary directory for test files
-            temp_dir = tempfile.mkdtemp()
-            
-            # Generate test files
-            self._generate_test_files(temp_dir, suite, algorithm_code)
-            
-            # Run tests in Docker container
-            container = self._create_test_container(temp_dir)
-            
+            # Lightweight path: no container at all for trusted suites
+            if self.sandbox_mode == "subprocess":
+                return self._run_tests_in_subprocess(suite, algorithm_code)
+
+            # Serialize the test files straight into an in-memory tar -
+            # no host-FS writes, no tempdir to clean up
+            archive = self._generate_test_archive(suite, algorithm_code)
+
+            # Warm path: exec pytest in a pooled runner, skipping the
+            # container cold start entirely
+            if self._runner_containers:
+                runner = self._acquire_runner()
+                try:
+                    runner.put_archive('/app/tests', archive)
+                    return self._execute_tests_in_runner(runner, suite)
+                finally:
+                    self._release_runner(runner)
+
+            # Cold path: fresh container per suite
+            container = self._create_test_container(suite, archive)
+
             # Execute tests and collect results
             result = self._execute_tests(container, suite)
-            
+
             return result
             
         except Exception as e:
@@ -260,69 +465,113 @@ CMD ["pytest", "--tb=short", "-v"]
                     container.remove()
                 except:
                     pass
-            
-            if temp_dir:
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
     
-    def _generate_test_files(self, temp_dir: str, suite: TestSuite, algorithm_code: str):
-        """Generate pytest test files"""
-        
-        # Create algorithm file
-        algorithm_file = os.path.join(temp_dir, f"{suite.algorithm_name}.py")
-        with open(algorithm_file, 'w') as f:
-            f.write(algorithm_code)
-        
-        # Create test file
-        test_file = os.path.join(temp_dir, f"test_{suite.algorithm_name}.py")
-        test_content = self._generate_test_content(suite)
-        
-        with open(test_file, 'w') as f:
-            f.write(test_content)
-        
-        # Create pytest configuration
-        pytest_ini = os.path.join(temp_dir, "pytest.ini")
-        with open(pytest_ini, 'w') as f:
-            f.write("""
+    async def run_test_suite_async(
+        self,
+        algorithm_name: str,
+        algorithm_code: str,
+        custom_test_cases: List[TestCase] = None
+    ) -> TestSuiteResult:
+        """Async entry point for concurrent suite runs.
+
+        The blocking docker-py pipeline is pushed onto a worker thread so
+        that many suites running at once overlap their daemon round-trips
+        (container start, wait, get_archive) instead of serializing the
+        event loop. Combined with the warm runner pool this gives
+        per-suite concurrency without a second Docker client.
+        """
+        return await asyncio.to_thread(
+            self.run_test_suite, algorithm_name, algorithm_code, custom_test_cases
+        )
+
+    def _generate_test_archive(self, suite: TestSuite, algorithm_code: str) -> bytes:
+        """Generate pytest test files as an in-memory tar archive.
+
+        The files used to be written to a host tempdir and bind-mounted -
+        a slow round-trip through the host filesystem on Docker Desktop.
+        One put_archive into the container's tmpfs replaces all of it.
+        Bundles are cached by a digest of (code, suite name) so repeat
+        submissions of identical code reuse the tar bytes outright.
+        """
+        cache_key = hashlib.blake2b(
+            algorithm_code.encode('utf-8') + suite.name.encode('utf-8'),
+            digest_size=16,
+        ).hexdigest()
+        cached = self._archive_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        files = {
+            f"{suite.algorithm_name}.py": algorithm_code,
+            f"test_{suite.algorithm_name}.py": self._generate_test_content(suite),
+            "pytest.ini": self._generate_pytest_ini(suite),
+            "conftest.py": self._generate_conftest(),
+        }
+
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w') as tar:
+            for filename, content in files.items():
+                data = content.encode('utf-8')
+                info = tarfile.TarInfo(name=filename)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                tar.addfile(info, io.BytesIO(data))
+
+        archive = buf.getvalue()
+        if len(self._archive_cache) >= 64:  # drop oldest entry, keep it bounded
+            self._archive_cache.pop(next(iter(self._archive_cache)))
+        self._archive_cache[cache_key] = archive
+        return archive
+
+    def _generate_pytest_ini(self, suite: TestSuite) -> str:
+        """Generate the pytest configuration file content"""
+        return """
 [tool:pytest]
 testpaths = .
 python_files = test_*.py
 python_classes = Test*
 python_functions = test_*
-addopts = 
+addopts =
     --tb=short
-    --strict-markers
-    --strict-config
-    --cov={algorithm_name}
-    --cov-report=json
-    --benchmark-json=benchmark_results.json
     --timeout=30
 markers =
     slow: marks tests as slow
     benchmark: marks tests as benchmarks
     security: marks tests as security tests
-""".format(algorithm_name=suite.algorithm_name))
-        
-        # Create conftest.py for fixtures
-        conftest_file = os.path.join(temp_dir, "conftest.py")
-        with open(conftest_file, 'w') as f:
-            f.write("""
+    memcheck: opt in to tracemalloc memory tracking
+"""
+
+    def _generate_conftest(self) -> str:
+        """Generate the conftest.py fixture file content"""
+        return """
 import pytest
 import time
-import tracemalloc
-import gc
 
 @pytest.fixture(autouse=True)
-def memory_tracker():
-    \"\"\"Track memory usage for each test\"\"\"
+def memory_tracker(request):
+    \"\"\"Track memory usage - opt-in via @pytest.mark.memcheck.
+
+    tracemalloc + gc.collect around every test costs milliseconds while
+    the algorithms under test run in microseconds; blanket instrumentation
+    dominated the suite's wall time.
+    \"\"\"
+    if request.node.get_closest_marker("memcheck") is None:
+        yield
+        return
+
+    # Imported here so every xdist worker that never runs a memcheck
+    # test skips them entirely
+    import gc
+    import tracemalloc
+
     tracemalloc.start()
     gc.collect()
-    
+
     yield
-    
+
     current, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
-    
+
     # Store memory stats (pytest will capture this)
     print(f"MEMORY_STATS: current={current}, peak={peak}")
 
@@ -336,131 +585,146 @@ def performance_timer():
     end_time = time.perf_counter()
     execution_time = end_time - start_time
     print(f"EXECUTION_TIME: {execution_time}")
-""")
-    
+"""
+
+
     def _generate_test_content(self, suite: TestSuite) -> str:
         """Generate pytest test content"""
-        
+
+        # Content is static per registered suite; custom suites carry
+        # their own cases so only the registered ones are cacheable
+        cacheable = self.test_suites.get(suite.algorithm_name) is suite
+        if cacheable:
+            cached = self._test_content_cache.get(suite.algorithm_name)
+            if cached is not None:
+                return cached
+
+        # Pick the call shape once, here, so the generated code has no
+        # dispatch left to do at test time
+        fn = self._get_function_name(suite.algorithm_name)
+        call = self._CALL_TEMPLATES.get(
+            suite.algorithm_name, "{fn}(input_data)"
+        ).format(fn=fn)
+
         imports = f"""
 import pytest
 import json
 import time
-import tracemalloc
 from {suite.algorithm_name} import *
 
 class Test{suite.algorithm_name.title()}:
     \"\"\"Comprehensive test suite for {suite.algorithm_name}\"\"\"
 """
         
-        # Generate individual test methods
-        test_methods = []
-        for i, test_case in enumerate(suite.test_cases):
-            method_name = f"test_{test_case.name}"
-            
-            test_method = f"""
-    def {method_name}(self, performance_timer):
-        \"\"\"Test: {test_case.description or test_case.name}\"\"\"
-        # Input data
-        input_data = {json.dumps(test_case.input_data)}
-        expected = {json.dumps(test_case.expected_output)}
-        
+        # One parametrized test covers every case: pytest collects a single
+        # item and dispatches, instead of paying collection + fixture setup
+        # per generated method
+        case_rows = ",".join(
+            f'["{tc.name}", {tc.input_json}, {tc.expected_json}]'
+            for tc in suite.test_cases
+        )
+        test_methods = [f"""
+    CASES = json.loads(r'''[{case_rows}]''')
+
+    @pytest.mark.parametrize(
+        "case_name,input_data,expected",
+        CASES,
+        ids=[case[0] for case in CASES]
+    )
+    def test_case(self, case_name, input_data, expected, performance_timer):
+        \"\"\"Parametrized over all {suite.algorithm_name} test cases\"\"\"
         # Execute algorithm
-        if "{suite.algorithm_name}" == "two_sum":
-            result = {self._get_function_name(suite.algorithm_name)}(input_data["nums"], input_data["target"])
-        elif "{suite.algorithm_name}" == "binary_search":
-            result = {self._get_function_name(suite.algorithm_name)}(input_data["arr"], input_data["target"])
-        elif "{suite.algorithm_name}" == "max_area":
-            result = {self._get_function_name(suite.algorithm_name)}(input_data["height"])
-        else:
-            # Generic call
-            result = {self._get_function_name(suite.algorithm_name)}(input_data)
-        
+        result = {call}
+
         # Validate result
         if expected is not None:
             assert result == expected, f"Expected {{expected}}, got {{result}}"
         else:
             # For tests where we just want to ensure no errors
             assert result is not None
-"""
-            test_methods.append(test_method)
+"""]
         
         # Generate benchmark tests
+        bench_data = self._BENCH_DATA_TEMPLATES.get(
+            suite.algorithm_name, "test_data = list(range(input_size))"
+        )
+        bench_call = self._BENCH_CALL_TEMPLATES.get(
+            suite.algorithm_name, "benchmark({fn}, test_data)"
+        ).format(fn=fn)
         benchmark_methods = []
+        bench_fixture = ""
         if suite.benchmarks:
-            for i, benchmark in enumerate(suite.benchmarks):
-                benchmark_method = f"""
-    @pytest.mark.benchmark
-    def test_benchmark_{i}(self, benchmark):
-        \"\"\"Benchmark test with input size {benchmark['input_size']}\"\"\"
-        input_size = {benchmark['input_size']}
-        
-        # Generate test data based on algorithm
-        if "{suite.algorithm_name}" == "two_sum":
-            nums = list(range(input_size))
-            target = input_size * 2 - 3
-            test_data = {{"nums": nums, "target": target}}
-        elif "{suite.algorithm_name}" == "binary_search":
-            arr = list(range(input_size))
-            target = input_size // 2
-            test_data = {{"arr": arr, "target": target}}
-        elif "{suite.algorithm_name}" == "max_area":
-            height = [i % 100 for i in range(input_size)]
-            test_data = {{"height": height}}
-        else:
-            test_data = list(range(input_size))
-        
-        # Benchmark the algorithm
-        if "{suite.algorithm_name}" == "two_sum":
-            result = benchmark({self._get_function_name(suite.algorithm_name)}, test_data["nums"], test_data["target"])
-        elif "{suite.algorithm_name}" == "binary_search":
-            result = benchmark({self._get_function_name(suite.algorithm_name)}, test_data["arr"], test_data["target"])
-        elif "{suite.algorithm_name}" == "max_area":
-            result = benchmark({self._get_function_name(suite.algorithm_name)}, test_data["height"])
-        else:
-            result = benchmark({self._get_function_name(suite.algorithm_name)}, test_data)
+            sizes = [b['input_size'] for b in suite.benchmarks]
+            # Payloads are built once per size in a module-scoped fixture;
+            # building them in the test body billed list construction to
+            # the measurement on every benchmark round
+            bench_fixture = f"""
+
+@pytest.fixture(scope="module", params={sizes})
+def bench_data(request):
+    \"\"\"Prebuilt benchmark payload, one per input size\"\"\"
+    input_size = request.param
+    {bench_data}
+    return test_data
 """
-                benchmark_methods.append(benchmark_method)
+            benchmark_methods.append(f"""
+    @pytest.mark.benchmark
+    def test_benchmark(self, benchmark, bench_data):
+        \"\"\"Benchmark the algorithm over prebuilt payloads\"\"\"
+        test_data = bench_data
+        result = {bench_call}
+""")
+            # Opt-in JIT benchmark: njit-compile the function so the numeric
+            # scan runs as native code - reveals algorithmic rather than
+            # interpreter differences. First pedantic warm-up round absorbs
+            # the compile; pure-Python numbers above stay the default
+            if any(b.get("jit") for b in suite.benchmarks):
+                bench_args = self._BENCH_ARGS_TEMPLATES.get(
+                    suite.algorithm_name, "(test_data,)"
+                )
+                benchmark_methods.append(f"""
+    @pytest.mark.benchmark
+    def test_benchmark_jit(self, benchmark, bench_data):
+        \"\"\"Benchmark the njit-compiled algorithm over prebuilt payloads\"\"\"
+        numba = pytest.importorskip("numba")
+        test_data = bench_data
+        compiled = numba.njit(cache=True)({fn})
+        result = benchmark.pedantic(compiled, args={bench_args}, rounds=20, warmup_rounds=1)
+""")
         
         # Security tests
+        security_large = self._SECURITY_LARGE_TEMPLATES.get(
+            suite.algorithm_name, "pass  # no large-input scenario for this algorithm"
+        ).format(fn=fn)
+        security_edge = self._SECURITY_EDGE_TEMPLATES.get(
+            suite.algorithm_name, "pass  # no edge cases defined for this algorithm"
+        ).format(fn=fn)
         security_tests = f"""
     @pytest.mark.security
     def test_security_large_input(self):
         \"\"\"Test algorithm with very large input\"\"\"
         try:
-            if "{suite.algorithm_name}" == "two_sum":
-                large_nums = list(range(100000))
-                result = {self._get_function_name(suite.algorithm_name)}(large_nums, 199999)
-            elif "{suite.algorithm_name}" == "binary_search":
-                large_arr = list(range(100000))
-                result = {self._get_function_name(suite.algorithm_name)}(large_arr, 50000)
+            {security_large}
             # Should complete without crashing
             assert True
         except MemoryError:
             pytest.skip("Memory limit exceeded - this is expected behavior")
         except Exception as e:
             pytest.fail(f"Unexpected error with large input: {{e}}")
-    
+
     @pytest.mark.security
     def test_security_edge_cases(self):
         \"\"\"Test algorithm with edge cases that might cause issues\"\"\"
         try:
-            if "{suite.algorithm_name}" == "two_sum":
-                # Test with empty array
-                result = {self._get_function_name(suite.algorithm_name)}([], 0)
-                assert result == []
-                
-                # Test with single element
-                result = {self._get_function_name(suite.algorithm_name)}([1], 1)
-                assert result == []
-            elif "{suite.algorithm_name}" == "binary_search":
-                # Test with empty array
-                result = {self._get_function_name(suite.algorithm_name)}([], 1)
-                assert result == -1
+            {security_edge}
         except Exception as e:
             pytest.fail(f"Edge case handling failed: {{e}}")
 """
         
-        return imports + "\n".join(test_methods) + "\n".join(benchmark_methods) + security_tests
+        content = imports + "\n".join(test_methods) + "\n".join(benchmark_methods) + security_tests + bench_fixture
+        if cacheable:
+            self._test_content_cache[suite.algorithm_name] = content
+        return content
     
     def _get_function_name(self, algorithm_name: str) -> str:
         """Get the expected function name for an algorithm"""
@@ -471,80 +735,206 @@ class Test{suite.algorithm_name.title()}:
         }
         return function_names.get(algorithm_name, algorithm_name)
     
-    def _create_test_container(self, temp_dir: str) -> docker.models.containers.Container:
-        """Create Docker container for test execution"""
-        
+    def _pytest_command(self, suite: TestSuite) -> List[str]:
+        """Build the coverage-then-benchmark shell invocation for a suite.
+
+        ';' not '&&' - the benchmark pass should still produce its report
+        when a functional test fails.
+        """
+        script = "{}; {}".format(
+            self.COVERAGE_PASS.format(algorithm_name=suite.algorithm_name),
+            self.BENCHMARK_PASS,
+        )
+        return ["sh", "-c", script]
+
+    def _create_test_container(self, suite: TestSuite, archive: bytes) -> docker.models.containers.Container:
+        """Create Docker container for test execution.
+
+        The workspace is a tmpfs populated via put_archive before start -
+        no bind mount, so nothing crosses the host filesystem.
+        """
         container_config = {
             "image": "algorithm-tester:latest",
-            "command": [
-                "pytest", 
-                "--tb=short", 
-                "-v", 
-                "--json-report",
-                "--json-report-file=test_results.json",
-                "--cov-report=json:coverage.json",
-                "--benchmark-json=benchmark_results.json"
-            ],
+            "command": self._pytest_command(suite),
             "working_dir": "/app/tests",
-            "volumes": {
-                temp_dir: {"bind": "/app/tests", "mode": "rw"}
-            },
+            "tmpfs": {"/app/tests": "rw,size=64m"},
             "mem_limit": "256m",
-            "cpu_quota": 100000,  # 100% of one core
+            "cpu_quota": 400000,  # 4 cores so the xdist workers actually run in parallel
             "cpu_period": 100000,
             "network_disabled": True,
             "user": "tester",
-            "detach": True,
-            "remove": False
+            "detach": True
         }
-        
-        container = self.docker_client.containers.run(**container_config)
+
+        # create (not run) so the files are in place before pytest starts
+        container = self.docker_client.containers.create(**container_config)
+        container.put_archive('/app/tests', archive)
+        container.start()
         return container
-    
+
+    def _execute_tests_in_runner(self, container, suite: TestSuite) -> TestSuiteResult:
+        """Execute tests via exec_run in a warm pooled runner"""
+        try:
+            exit_code, output = container.exec_run(
+                self._pytest_command(suite), workdir="/app/tests"
+            )
+            logs = output.decode('utf-8')
+
+            test_results, benchmark_results, coverage_percentage = self._parse_test_results(
+                container, logs
+            )
+            return self._build_suite_result(
+                suite, test_results, benchmark_results, coverage_percentage
+            )
+        except Exception as e:
+            logger.error(f"Failed to execute tests in runner: {e}")
+            raise
+
+    def _build_suite_result(
+        self,
+        suite: TestSuite,
+        test_results: List[TestResult],
+        benchmark_results: List[BenchmarkResult],
+        coverage_percentage: float
+    ) -> TestSuiteResult:
+        """Assemble the suite-level result from parsed per-test data"""
+        bench_count = len(suite.benchmarks or [])
+        if any(b.get("jit") for b in suite.benchmarks or []):
+            bench_count *= 2  # the jit variant runs over the same sizes
+        total_tests = len(suite.test_cases) + bench_count + 2  # +2 for security tests
+        passed_tests = sum(1 for r in test_results if r.passed)
+        failed_tests = total_tests - passed_tests
+
+        return TestSuiteResult(
+            suite_name=suite.name,
+            algorithm_name=suite.algorithm_name,
+            total_tests=total_tests,
+            passed_tests=passed_tests,
+            failed_tests=failed_tests,
+            execution_time=sum(r.execution_time for r in test_results),
+            coverage_percentage=coverage_percentage,
+            test_results=test_results,
+            benchmark_results=benchmark_results,
+            security_score=self._calculate_security_score(test_results)
+        )
+
+    def _run_tests_in_subprocess(self, suite: TestSuite, algorithm_code: str) -> TestSuiteResult:
+        """Run the suite in a sandboxed subprocess, bypassing Docker.
+
+        For trivial pure-Python suites the per-run container tax dwarfs
+        the tests themselves. firejail provides the sandbox when it is
+        installed; otherwise the child process is confined with rlimits.
+        """
+        with tempfile.TemporaryDirectory(prefix="test_sandbox_") as temp_dir:
+            files = {
+                f"{suite.algorithm_name}.py": algorithm_code,
+                f"test_{suite.algorithm_name}.py": self._generate_test_content(suite),
+                "pytest.ini": self._generate_pytest_ini(suite),
+                "conftest.py": self._generate_conftest(),
+            }
+            for filename, content in files.items():
+                with open(os.path.join(temp_dir, filename), 'w') as f:
+                    f.write(content)
+
+            preexec = None
+            if shutil.which("firejail"):
+                command = [
+                    "firejail", "--quiet", "--noprofile", "--net=none",
+                    f"--private={temp_dir}",
+                    "--rlimit-cpu=30", "--rlimit-as=268435456",
+                ] + self._pytest_command(suite)
+            else:
+                command = self._pytest_command(suite)
+
+                def preexec():
+                    resource.setrlimit(resource.RLIMIT_CPU, (30, 30))
+                    limit = 256 * 1024 * 1024
+                    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+            completed = subprocess.run(
+                command,
+                cwd=temp_dir,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                preexec_fn=preexec,
+            )
+
+            # Same report files as the container path, read off disk
+            report_files: Dict[str, bytes] = {}
+            for name in self.RESULT_FILES:
+                path = os.path.join(temp_dir, name)
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        report_files[name] = f.read()
+
+            logs = (completed.stdout or "") + (completed.stderr or "")
+            test_results, benchmark_results, coverage_percentage = self._parse_report_files(
+                report_files, logs
+            )
+            return self._build_suite_result(
+                suite, test_results, benchmark_results, coverage_percentage
+            )
+
     def _execute_tests(
-        self, 
-        container: docker.models.containers.Container, 
+        self,
+        container: docker.models.containers.Container,
         suite: TestSuite
     ) -> TestSuiteResult:
         """Execute tests and parse results"""
-        
+
         try:
+            # Drain logs concurrently with the run - waiting first and
+            # pulling the whole buffer afterwards serialized that latency
+            log_chunks: List[bytes] = []
+
+            def _drain_logs():
+                try:
+                    for chunk in container.logs(stream=True, follow=True):
+                        log_chunks.append(chunk)
+                except Exception as e:
+                    logger.debug(f"Log stream ended: {e}")
+
+            reader = threading.Thread(target=_drain_logs, daemon=True)
+            reader.start()
+
             # Wait for tests to complete
             exit_code = container.wait(timeout=120)  # 2 minute timeout
-            
-            # Get test output
-            logs = container.logs().decode('utf-8')
-            
+            reader.join(timeout=5)
+
+            logs = b''.join(log_chunks).decode('utf-8')
+
             # Try to get structured results
             test_results, benchmark_results, coverage_percentage = self._parse_test_results(
                 container, logs
             )
-            
-            # Calculate metrics
-            total_tests = len(suite.test_cases) + len(suite.benchmarks or []) + 2  # +2 for security tests
-            passed_tests = sum(1 for r in test_results if r.passed)
-            failed_tests = total_tests - passed_tests
-            
-            # Calculate security score
-            security_score = self._calculate_security_score(test_results)
-            
-            return TestSuiteResult(
-                suite_name=suite.name,
-                algorithm_name=suite.algorithm_name,
-                total_tests=total_tests,
-                passed_tests=passed_tests,
-                failed_tests=failed_tests,
-                execution_time=sum(r.execution_time for r in test_results),
-                coverage_percentage=coverage_percentage,
-                test_results=test_results,
-                benchmark_results=benchmark_results,
-                security_score=security_score
+
+            return self._build_suite_result(
+                suite, test_results, benchmark_results, coverage_percentage
             )
-            
+
         except Exception as e:
             logger.error(f"Failed to execute tests: {e}")
             raise
     
+    # Report files pulled back from the container after a run
+    RESULT_FILES = ('test_results.json', 'benchmark_results.json', 'coverage.json')
+
+    def _fetch_result_files(self, container) -> Dict[str, bytes]:
+        """Download all report JSONs (as raw bytes) in one get_archive call"""
+        bits, _stat = container.get_archive('/app/tests')
+        buf = io.BytesIO(b''.join(bits))
+
+        results: Dict[str, bytes] = {}
+        with tarfile.open(fileobj=buf) as tar:
+            for member in tar.getmembers():
+                name = os.path.basename(member.name)
+                if name in self.RESULT_FILES:
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        results[name] = extracted.read()
+        return results
+
     def _parse_test_results(
         self, 
         container: docker.models.containers.Container, 
@@ -552,20 +942,37 @@ class Test{suite.algorithm_name.title()}:
     ) -> tuple:
         """Parse test results from container"""
         
+        try:
+            # One archive round-trip brings back every report file; the
+            # previous three exec_run("cat ...") calls each spawned a
+            # process in the container and round-tripped the Docker API
+            report_files = self._fetch_result_files(container)
+        except Exception as e:
+            logger.warning(f"Failed to fetch report files: {e}")
+            report_files = {}
+
+        return self._parse_report_files(report_files, logs)
+
+    def _parse_report_files(self, report_files: Dict[str, bytes], logs: str) -> tuple:
+        """Parse report JSONs shared by the container and subprocess paths.
+
+        Test and benchmark records are streamed one at a time (via ijson
+        when installed) rather than materializing the whole report.
+        """
         test_results = []
         benchmark_results = []
         coverage_percentage = 0.0
-        
+
         try:
-            # Try to get JSON results
-            exec_result = container.exec_run("cat test_results.json")
-            if exec_result.exit_code == 0:
-                json_data = json.loads(exec_result.output.decode('utf-8'))
-                
+            raw_tests = report_files.get('test_results.json')
+            if raw_tests is not None:
                 # Parse individual test results
-                for test in json_data.get('tests', []):
+                for test in _iter_report_items(raw_tests, 'tests'):
                     result = TestResult(
-                        test_name=test['nodeid'],
+                        # Lowercased once here so downstream substring
+                        # checks ('security' in name) skip the per-call
+                        # lower()
+                        test_name=test['nodeid'].lower(),
                         passed=test['outcome'] == 'passed',
                         execution_time=test.get('duration', 0),
                         memory_usage=0,  # Will extract from logs
@@ -576,12 +983,9 @@ class Test{suite.algorithm_name.title()}:
                     )
                     test_results.append(result)
             
-            # Try to get benchmark results
-            benchmark_exec = container.exec_run("cat benchmark_results.json")
-            if benchmark_exec.exit_code == 0:
-                benchmark_data = json.loads(benchmark_exec.output.decode('utf-8'))
-                
-                for benchmark in benchmark_data.get('benchmarks', []):
+            raw_benchmarks = report_files.get('benchmark_results.json')
+            if raw_benchmarks is not None:
+                for benchmark in _iter_report_items(raw_benchmarks, 'benchmarks'):
                     result = BenchmarkResult(
                         name=benchmark['name'],
                         input_size=0,  # Will extract from name
@@ -596,11 +1000,10 @@ class Test{suite.algorithm_name.title()}:
                     )
                     benchmark_results.append(result)
             
-            # Try to get coverage
-            coverage_exec = container.exec_run("cat coverage.json")
-            if coverage_exec.exit_code == 0:
-                coverage_data = json.loads(coverage_exec.output.decode('utf-8'))
-                coverage_percentage = coverage_data.get('totals', {}).get('percent_covered', 0)
+            raw_coverage = report_files.get('coverage.json')
+            if raw_coverage is not None:
+                # Small summary document - no need to stream this one
+                coverage_percentage = _json_loads(raw_coverage).get('totals', {}).get('percent_covered', 0)
             
         except Exception as e:
             logger.warning(f"Failed to parse structured results: {e}")
@@ -613,8 +1016,7 @@ class Test{suite.algorithm_name.title()}:
         """Parse test results from logs as fallback"""
         results = []
         
-        lines = logs.split('\n')
-        for line in lines:
+        for line in logs.splitlines():
             if '::' in line and ('PASSED' in line or 'FAILED' in line):
                 parts = line.split('::')
                 test_name = parts[-1].split(' ')[0]
@@ -636,13 +1038,16 @@ class Test{suite.algorithm_name.title()}:
     
     def _calculate_security_score(self, test_results: List[TestResult]) -> float:
         """Calculate security score based on test results"""
-        security_tests = [r for r in test_results if 'security' in r.test_name.lower()]
-        
-        if not security_tests:
+        # Single pass - no intermediate filtered list to allocate
+        total = passed = 0
+        for r in test_results:
+            if 'security' in r.test_name:
+                total += 1
+                passed += r.passed
+
+        if not total:
             return 0.5  # Neutral score if no security tests
-        
-        passed_security = sum(1 for r in security_tests if r.passed)
-        return (passed_security / len(security_tests)) * 100
+        return (passed / total) * 100
     
     def get_available_test_suites(self) -> List[str]:
         """Get list of available test suites"""
@@ -650,4 +1055,5 @@ class Test{suite.algorithm_name.title()}:
     
     def add_custom_test_suite(self, suite: TestSuite):
         """Add a custom test suite"""
+        self._serialize_test_payloads(suite)
         self.test_suites[suite.algorithm_name] = suite
@@ -4,7 +4,7 @@ Organized by difficulty and frequency at Amazon interviews.
 Each problem includes multiple solution approaches and detailed explanations.
 """
 
-from collections import deque, defaultdict
+from collections import OrderedDict, defaultdict
 import heapq
 
 # =============================================================================
@@ -198,12 +198,12 @@ def find_minimum_in_rotated_array(nums):
     while left < right:
         mid = left + (right - left) // 2
         
-        # If mid > right, minimum is in right half
-        if nums[mid] > nums[right]:
-            left = mid + 1
-        # If mid <= right, minimum is in left half (including mid)
-        else:
-            right = mid
+        # Conditional-expression pivot update: evaluates the comparison
+        # once and assigns both bounds without a taken branch - the form
+        # a C compiler turns into cmov if this ever moves to native code
+        in_right_half = nums[mid] > nums[right]
+        left = mid + 1 if in_right_half else left
+        right = right if in_right_half else mid
     
     return nums[left]
 
@@ -233,6 +233,27 @@ def search_2d_matrix(matrix, target):
     
     return False
 
+
+def search_2d_matrix_batch(matrix, targets):
+    """
+    Batched variant of LC 74 for the "millions of lookups" follow-up.
+    
+    Flattens the row-major-sorted matrix once (zero-copy view for a
+    NumPy input) and answers every query with a single vectorized
+    searchsorted - one C call instead of N Python binary searches.
+    Returns a boolean mask aligned with targets.
+    """
+    import numpy as np  # heavyweight dependency, only for the batch path
+    
+    flat = np.asarray(matrix, dtype=np.int64).ravel()
+    targets = np.asarray(targets, dtype=np.int64)
+    
+    if flat.size == 0:
+        return np.zeros(targets.shape, dtype=bool)
+    
+    idx = np.searchsorted(flat, targets)
+    return (idx < flat.size) & (flat[np.minimum(idx, flat.size - 1)] == targets)
+
 # =============================================================================
 # HOUR 4-5: TREES - COMPREHENSIVE PATTERNS
 # =============================================================================
@@ -251,26 +272,51 @@ def serialize_deserialize_tree(root):
     This is a design problem - show different approaches
     """
     def serialize(root):
-        """Preorder traversal with null markers"""
-        if not root:
-            return "null"
+        """Preorder traversal with null markers - explicit stack.
+        
+        No recursion frame per node, and the tokens are joined once at
+        the end instead of building O(n) intermediate strings
+        """
+        tokens = []
+        stack = [root]
         
-        return f"{root.val},{serialize(root.left)},{serialize(root.right)}"
+        while stack:
+            node = stack.pop()
+            if node is None:
+                tokens.append("null")
+                continue
+            
+            tokens.append(str(node.val))
+            # Right pushed first so left is processed first (preorder)
+            stack.append(node.right)
+            stack.append(node.left)
+        
+        return ",".join(tokens)
     
     def deserialize(data):
-        """Reconstruct tree from preorder string"""
-        def build_tree():
-            val = next(vals)
+        """Reconstruct tree from preorder string - explicit slot stack"""
+        tokens = iter(data.split(','))
+        
+        root_val = next(tokens)
+        if root_val == "null":
+            return None
+        
+        root = TreeNode(int(root_val))
+        # Each entry is (parent, side) - the slot the next token fills.
+        # Left pops before right, matching preorder token order
+        slots = [(root, 'right'), (root, 'left')]
+        
+        for val in tokens:
+            parent, side = slots.pop()
             if val == "null":
-                return None
+                continue
             
             node = TreeNode(int(val))
-            node.left = build_tree()
-            node.right = build_tree()
-            return node
+            setattr(parent, side, node)
+            slots.append((node, 'right'))
+            slots.append((node, 'left'))
         
-        vals = iter(data.split(','))
-        return build_tree()
+        return root
     
     # Example usage
     serialized = serialize(root)
@@ -282,27 +328,28 @@ def binary_tree_right_side_view(root):
     AMAZON FREQUENCY: HIGH
     
     Level order traversal - keep track of rightmost node at each level
+    
+    Two-list ping-pong instead of deque.popleft: each level is read
+    sequentially (never actually popped from the front), and plain-list
+    iteration is CPython's fastest node walk
     """
     if not root:
         return []
     
     result = []
-    queue = deque([root])
+    current = [root]
     
-    while queue:
-        level_size = len(queue)
+    while current:
+        # Rightmost node of this level is simply the last element
+        result.append(current[-1].val)
         
-        for i in range(level_size):
-            node = queue.popleft()
-            
-            # If this is the last node in current level
-            if i == level_size - 1:
-                result.append(node.val)
-            
+        next_level = []
+        for node in current:
             if node.left:
-                queue.append(node.left)
+                next_level.append(node.left)
             if node.right:
-                queue.append(node.right)
+                next_level.append(node.right)
+        current = next_level
     
     return result
 
@@ -335,31 +382,111 @@ def path_sum_all_paths(root, target_sum):
     AMAZON FREQUENCY: MEDIUM-HIGH
     
     Find all root-to-leaf paths with given sum
-    Backtracking pattern
+    Backtracking pattern - one preallocated buffer indexed by depth
     """
-    def dfs(node, remaining, path, result):
-        if not node:
-            return
-        
-        # Add current node to path
-        path.append(node.val)
+    if not root:
+        return []
+    
+    # Height first, so a single flat buffer can hold any root-to-leaf
+    # path: backtracking becomes an in-place index write, no append/pop
+    height = 0
+    stack = [(root, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if depth > height:
+            height = depth
+        if node.left:
+            stack.append((node.left, depth + 1))
+        if node.right:
+            stack.append((node.right, depth + 1))
+    
+    path = [0] * height
+    result = []
+    
+    def dfs(node, remaining, depth):
+        path[depth] = node.val
         remaining -= node.val
         
         # Check if this is a leaf with target sum
         if not node.left and not node.right and remaining == 0:
-            result.append(path[:])  # Make a copy
+            result.append(path[:depth + 1])  # Copy only the live prefix
+            return
         
         # Recurse on children
-        dfs(node.left, remaining, path, result)
-        dfs(node.right, remaining, path, result)
-        
-        # Backtrack
-        path.pop()
+        if node.left:
+            dfs(node.left, remaining, depth + 1)
+        if node.right:
+            dfs(node.right, remaining, depth + 1)
     
-    result = []
-    dfs(root, target_sum, [], result)
+    dfs(root, target_sum, 0)
     return result
 
+
+def flatten_tree(root):
+    """
+    Structure-of-arrays flattening for the "millions of requests against
+    the same tree" follow-up.
+    
+    TreeNode objects are scattered on the heap, so every left/right hop
+    is a potential cache miss. One BFS pass numbers the nodes 0..n-1 and
+    stores them as three parallel arrays (vals, left, right, -1 = no
+    child); bulk queries then become tight index loops over contiguous
+    memory instead of pointer chasing, and are numba/NumPy friendly.
+    """
+    import numpy as np  # heavyweight dependency, only for the SoA path
+    
+    if not root:
+        return (np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.int32))
+    
+    # BFS numbering: children always get larger indices than parents
+    nodes = [root]
+    for node in nodes:  # nodes grows while we iterate - intentional
+        if node.left:
+            nodes.append(node.left)
+        if node.right:
+            nodes.append(node.right)
+    
+    index = {id(node): i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    vals = np.empty(n, dtype=np.int64)
+    left = np.full(n, -1, dtype=np.int32)
+    right = np.full(n, -1, dtype=np.int32)
+    
+    for i, node in enumerate(nodes):
+        vals[i] = node.val
+        if node.left:
+            left[i] = index[id(node.left)]
+        if node.right:
+            right[i] = index[id(node.right)]
+    
+    return vals, left, right
+
+def max_depth_flat(left, right):
+    """
+    Max depth over the flattened form: an explicit stack of (index,
+    depth) ints - no TreeNode objects touched in the loop, so the walk
+    is a near-sequential scan of two int32 arrays
+    """
+    if len(left) == 0:
+        return 0
+    
+    max_depth = 0
+    stack = [(0, 1)]
+    
+    while stack:
+        i, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        l, r = left[i], right[i]
+        if l >= 0:
+            stack.append((l, depth + 1))
+        if r >= 0:
+            stack.append((r, depth + 1))
+    
+    return max_depth
+
 # =============================================================================
 # AMAZON SYSTEM DESIGN CODING QUESTIONS
 # =============================================================================
@@ -370,10 +497,50 @@ class LRUCache:
     AMAZON FREQUENCY: VERY HIGH
     
     This tests data structure design skills
-    Use doubly linked list + hash map
+    OrderedDict keeps insertion order in C: move_to_end() and
+    popitem(last=False) give the same O(1) recency bookkeeping as a
+    hand-rolled doubly linked list, without any Node objects or
+    prev/next pointer chasing in Python bytecode
+    """
+    
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.cache = OrderedDict()  # key -> value, oldest first
+    
+    def get(self, key):
+        if key not in self.cache:
+            return -1
+        # Mark as most recently used - single C call
+        self.cache.move_to_end(key)
+        return self.cache[key]
+    
+    def put(self, key, value):
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.cache[key] = value
+            return
+        
+        self.cache[key] = value
+        if len(self.cache) > self.capacity:
+            # Evict the least recently used entry
+            self.cache.popitem(last=False)
+
+
+class LRUCacheLinked:
+    """
+    LC 146 - LRU Cache (doubly linked list + hash map variant)
+    
+    The classic design-interview implementation, kept alongside the
+    OrderedDict version for when the interviewer wants the pointers
+    spelled out. Two allocation optimizations worth mentioning:
+    - __slots__ on Node: fixed slot layout instead of a per-node __dict__
+    - eviction reuses the popped tail node for the incoming key, so a
+      cache running at capacity does zero allocations in steady state
     """
     
     class Node:
+        __slots__ = ('key', 'val', 'prev', 'next')
+        
         def __init__(self, key=0, val=0):
             self.key = key
             self.val = val
@@ -429,22 +596,32 @@ class LRUCache:
             # Update existing key
             node.val = value
             self._move_to_head(node)
+            return
+        
+        if len(self.cache) >= self.capacity:
+            # Recycle the LRU node for the new key - no Node() call,
+            # no allocator or GC traffic while churning at capacity
+            node = self._pop_tail()
+            del self.cache[node.key]
+            node.key = key
+            node.val = value
         else:
-            # Add new key
-            new_node = self.Node(key, value)
-            
-            if len(self.cache) >= self.capacity:
-                # Remove LRU item
-                tail = self._pop_tail()
-                del self.cache[tail.key]
-            
-            self.cache[key] = new_node
-            self._add_node(new_node)
+            node = self.Node(key, value)
+        
+        self.cache[key] = node
+        self._add_node(node)
 
 # =============================================================================
 # AMAZON BEHAVIORAL + TECHNICAL INTEGRATION
 # =============================================================================
 
+class ListNode:
+    __slots__ = ('val', 'next')
+    
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
 def merge_k_sorted_lists(lists):
     """
     LC 23 - Merge k Sorted Lists
@@ -460,25 +637,29 @@ def merge_k_sorted_lists(lists):
     if not lists:
         return None
     
-    # Min heap approach
-    heap = []
-    dummy = ListNode(0)
-    current = dummy
+    # Min heap approach. heapq's push/pop are C, so the remaining
+    # interpreter cost is name lookups in this loop - bind them (and
+    # heapify instead of k pushes) so each iteration is two C calls
+    heappush = heapq.heappush
+    heappop = heapq.heappop
     
     # Initialize heap with first node from each list
-    for i, head in enumerate(lists):
-        if head:
-            heapq.heappush(heap, (head.val, i, head))
+    heap = [(head.val, i, head) for i, head in enumerate(lists) if head]
+    heapq.heapify(heap)
+    
+    dummy = ListNode(0)
+    current = dummy
     
     # Process until heap is empty
     while heap:
-        val, list_idx, node = heapq.heappop(heap)
+        val, list_idx, node = heappop(heap)
         current.next = node
-        current = current.next
+        current = node
         
         # Add next node from the same list
-        if node.next:
-            heapq.heappush(heap, (node.next.val, list_idx, node.next))
+        nxt = node.next
+        if nxt:
+            heappush(heap, (nxt.val, list_idx, nxt))
     
     return dummy.next
 
@@ -4,6 +4,8 @@ These are the MUST-KNOW problems that appear most frequently in Amazon interview
 Focus on understanding the patterns, not memorizing solutions.
 """
 
+from bisect import bisect_left
+
 # =============================================================================
 # 1. TWO SUM PATTERN (HIGHEST PRIORITY)
 # =============================================================================
@@ -111,22 +113,13 @@ def max_subarray_sum(nums):
 
 def binary_search(nums, target):
     """
-    Classic binary search - know this by heart!
+    Classic binary search - know the loop by heart, but in real code
+    delegate to the C-implemented bisect module: one C call replaces
+    the whole Python loop.
     Time: O(log n), Space: O(1)
     """
-    left, right = 0, len(nums) - 1
-    
-    while left <= right:
-        mid = left + (right - left) // 2
-        
-        if nums[mid] == target:
-            return mid
-        elif nums[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    
-    return -1
+    i = bisect_left(nums, target)
+    return i if i < len(nums) and nums[i] == target else -1
 
 def search_rotated_array(nums, target):
     """
@@ -174,50 +167,75 @@ def level_order_traversal(root):
     if not root:
         return []
     
-    from collections import deque
-    queue = deque([root])
+    # Two-list ping-pong: each level is only ever read front to back,
+    # so plain lists beat deque.popleft for this access pattern
+    current = [root]
     result = []
     
-    while queue:
-        level_size = len(queue)
-        level = []
+    while current:
+        result.append([node.val for node in current])
         
-        for _ in range(level_size):
-            node = queue.popleft()
-            level.append(node.val)
-            
+        next_level = []
+        for node in current:
             if node.left:
-                queue.append(node.left)
+                next_level.append(node.left)
             if node.right:
-                queue.append(node.right)
-        
-        result.append(level)
+                next_level.append(node.right)
+        current = next_level
     
     return result
 
 def max_depth(root):
     """
     LC 104 - Maximum Depth of Binary Tree
-    Simple DFS - always asked
+    Iterative level-counting BFS - no recursion frame per node, and no
+    RecursionError on skewed trees
     """
     if not root:
         return 0
     
-    return 1 + max(max_depth(root.left), max_depth(root.right))
+    depth = 0
+    current = [root]
+    
+    while current:
+        depth += 1
+        next_level = []
+        for node in current:
+            if node.left:
+                next_level.append(node.left)
+            if node.right:
+                next_level.append(node.right)
+        current = next_level
+    
+    return depth
 
-def validate_bst(root, min_val=float('-inf'), max_val=float('inf')):
+def validate_bst(root):
     """
     LC 98 - Validate Binary Search Tree
     Very common at Amazon
+    
+    Iterative inorder walk: a BST yields strictly increasing values, so
+    track the previous value and reject on any non-increase. Explicit
+    stack means no per-node call frame and no recursion limit
     """
-    if not root:
-        return True
+    stack = []
+    prev = float('-inf')
+    current = root
     
-    if root.val <= min_val or root.val >= max_val:
-        return False
+    while stack or current:
+        # Descend to the leftmost unvisited node
+        while current:
+            stack.append(current)
+            current = current.left
+        
+        current = stack.pop()
+        if current.val <= prev:
+            return False
+        prev = current.val
+        
+        current = current.right
     
-    return (validate_bst(root.left, min_val, root.val) and 
-            validate_bst(root.right, root.val, max_val))
+    return True
 
 # =============================================================================
 # 5. DYNAMIC PROGRAMMING BASICS (MEDIUM PRIORITY)